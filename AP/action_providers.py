@@ -12,30 +12,34 @@ def allin_AP(game:PokerState, player:Player)-> str:
     return 'allin'
 
 def random_choice_AP(game:PokerState, player:Player)-> str:
-    
-    current_bet = max((p.bet for p in game.players), default=0)
-    amount_to_call = current_bet - player.bet
+
+    amount_to_call = game.current_bet - player.bet
+
+    # Single uniform draw compared against thresholds; avoids the list and
+    # cumulative-weight allocations random.choices makes on every call
+    r = random.random()
 
     if amount_to_call > 0:
-        choice = random.choices(['call', 'raise'], weights=[0.5, 0.5])[0]
-        if choice == 'call' or choice == 'allin':
-            return choice
+        # call vs raise, 50/50
+        if r < 0.5:
+            return 'call'
 
-        max_raise = max(0, player.chips.total() - amount_to_call)
+        max_raise = player.chips.total() - amount_to_call
         if max_raise <= 0:
             return 'call'
-        raise_amt = random.randint(1, max(1, max_raise))
+        raise_amt = 1 + int(random.random() * max_raise)
         return f'raise {raise_amt}'
 
-    # No outstanding bet: allow check, raise, or fold with probabilities
-    choice = random.choices(['check', 'raise', 'fold'], weights=[0.475, 0.475, 0.05])[0]
-    if choice != 'raise':
-        return choice
+    # No outstanding bet: check, raise, or fold with probabilities 0.475/0.475/0.05
+    if r < 0.475:
+        return 'check'
+    if r >= 0.95:
+        return 'fold'
 
     # raise when no call required: pick a small bet fraction of chips
     max_raise = player.chips.total()
     if max_raise <= 0:
         return 'check'
-    
-    raise_amt = max(1, int(max_raise * random.uniform(0.05, 0.25)))
+
+    raise_amt = max(1, int(max_raise * (0.05 + 0.20 * random.random())))
     return f'raise {raise_amt}'
\ No newline at end of file
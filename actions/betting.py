@@ -21,6 +21,16 @@ class BettingManager:
         """
         self.game = game
         self.action_providers = action_providers
+        # Action verb -> handler, consulted once per action instead of a
+        # startswith cascade. All handlers share one signature and return
+        # (is_valid, new_current_bet, last_raiser_idx or None).
+        self._action_handlers = {
+            'fold': self._process_fold,
+            'check': self._process_check,
+            'call': self._process_call,
+            'allin': self._process_allin,
+            'raise': self._process_raise,
+        }
     
     def preflop_betting_round(self):
         """Execute the preflop betting round with blinds."""
@@ -34,45 +44,30 @@ class BettingManager:
     
     def postflop_betting_round(self):
         """Execute a postflop betting round (flop, turn, or river)."""
-        # Reset bets for new round
-        for p in self.game.players:
-            p.bet = 0
-        
+        # Reset bets (and current bet) for new round
+        self.game.reset_bets()
+
         # First to act is left of dealer
         first_to_act = (self.game.dealer_index + 1) % len(self.game.players)
         return self._betting_round(first_to_act)
     
     # ========== Private/Internal Methods ==========
     
-    def _post_amount(self, player: Player, amount: int):
-        """Transfer chips from player to pot, handling insufficient funds."""
-        available = player.chips.total()
-        actual_amount = min(amount, available)
-        
-        if actual_amount > 0:
-            try:
-                player.chips.transfer_to(self.game.pot, actual_amount)
-                player.bet += actual_amount
-            except Exception as e:
-                print(f"Error transferring chips: {e}")
-    
     def _post_blinds(self):
         """Post small and big blinds."""
         num_players = len(self.game.players)
         small_idx = (self.game.dealer_index + 1) % num_players
         big_idx = (self.game.dealer_index + 2) % num_players
-        
-        # Reset all bets
-        for p in self.game.players:
-            p.bet = 0
-        
-        # Post blinds
-        self._post_amount(self.game.players[small_idx], self.game.blind_amount)
-        self._post_amount(self.game.players[big_idx], self.game.blind_amount * 2)
+
+        # Reset all bets, then post blinds; commit_bet keeps current_bet in
+        # step even when a blind is posted short all-in
+        self.game.reset_bets()
+        self.game.commit_bet(small_idx, self.game.blind_amount)
+        self.game.commit_bet(big_idx, self.game.blind_amount * 2)
     
     def _get_current_bet(self) -> int:
         """Get the current bet that players need to match."""
-        return max((p.bet for p in self.game.players), default=0)
+        return self.game.current_bet
     
     def _get_active_players(self) -> list[Player]:
         """Get players who haven't folded."""
@@ -115,64 +110,61 @@ class BettingManager:
                 print(f"Error awarding pot to Player {winner.player_num}: {e}")
 
         # Mark pot as awarded to prevent duplicate awarding elsewhere
-        setattr(self.game, '_pot_awarded', True)
+        self.game._pot_awarded = True
 
-        # Always print the winner, regardless of console/AI mode
-        print(f"Player {winner.player_num} wins ${pot_total} (everyone else folded)")
+        if is_console:
+            print(f"Player {winner.player_num} wins ${pot_total} (everyone else folded)")
 
         return winner
     
-    def _process_fold(self, player: Player, player_idx: int, is_console: bool) -> bool:
-        """Process a fold action. Returns True if action is valid."""
+    def _process_fold(self, action: str, player: Player, player_idx: int,
+                      current_bet: int, is_console: bool) -> tuple[bool, int, Optional[int]]:
+        """Process a fold action. Always valid."""
         player.folded = True
         if is_console:
             print(f"Player {player_idx} folded\n")
-        return True
-    
-    def _process_check(self, player: Player, player_idx: int, current_bet: int, is_console: bool) -> bool:
-        """Process a check action. Returns True if action is valid."""
+        return True, current_bet, None
+
+    def _process_check(self, action: str, player: Player, player_idx: int,
+                       current_bet: int, is_console: bool) -> tuple[bool, int, Optional[int]]:
+        """Process a check action. Invalid when chips are owed."""
         if player.bet != current_bet:
             if is_console:
                 print(f"Invalid: cannot check when {current_bet - player.bet} chips are owed. Try 'call' or 'raise'.\n")
-            return False
-        
+            return False, current_bet, None
+
         if is_console:
             print(f"Player {player_idx} checked\n")
-        return True
-    
-    def _process_call(self, player: Player, player_idx: int, current_bet: int, is_console: bool) -> bool:
-        """Process a call action. Returns True (always valid)."""
+        return True, current_bet, None
+
+    def _process_call(self, action: str, player: Player, player_idx: int,
+                      current_bet: int, is_console: bool) -> tuple[bool, int, Optional[int]]:
+        """Process a call action. Always valid."""
         amount_to_call = current_bet - player.bet
         if amount_to_call > 0:
-            self._post_amount(player, amount_to_call)
+            self.game.commit_bet(player_idx, amount_to_call)
             if is_console:
                 print(f"Player {player_idx} called {amount_to_call}")
                 print(f"Pot: {self.game.pot.total()}\n")
         else:
             if is_console:
                 print(f"Player {player_idx} checked (nothing to call)\n")
-        return True
-    
-    def _process_allin(self, player: Player, player_idx: int, current_bet: int, is_console: bool) -> tuple[bool, int, Optional[int]]:
+        return True, current_bet, None
+
+    def _process_allin(self, action: str, player: Player, player_idx: int,
+                       current_bet: int, is_console: bool) -> tuple[bool, int, Optional[int]]:
         """
-        Process an all-in action. 
+        Process an all-in action.
         Returns (is_valid, new_current_bet, last_raiser_idx or None)
         """
         amt = player.chips.total()
-        self._post_amount(player, amt)
-        
-        new_current_bet = current_bet
-        last_raiser = None
-        
-        if player.bet > current_bet:
-            new_current_bet = player.bet
-            last_raiser = player_idx
-        
+        raised = self.game.commit_bet(player_idx, amt)
+
         if is_console:
             print(f"Player {player_idx} went all-in for {amt}")
             print(f"Pot: {self.game.pot.total()}\n")
-        
-        return True, new_current_bet, last_raiser
+
+        return True, self.game.current_bet, player_idx if raised else None
     
     def _process_raise(self, action: str, player: Player, player_idx: int, 
                       current_bet: int, is_console: bool) -> tuple[bool, int, Optional[int]]:
@@ -196,30 +188,23 @@ class BettingManager:
         
         amount_to_call = current_bet - player.bet
         total_required = amount_to_call + raise_amt
-        self._post_amount(player, total_required)
-        
-        new_current_bet = current_bet
-        last_raiser = None
-        
-        if player.bet > current_bet:
-            new_current_bet = player.bet
-            last_raiser = player_idx
-        
+        raised = self.game.commit_bet(player_idx, total_required)
+
         if is_console:
             print(f"Player {player_idx} raised by {raise_amt} (total: {total_required})")
             print(f"Pot: {self.game.pot.total()}\n")
-        
-        return True, new_current_bet, last_raiser
+
+        return True, self.game.current_bet, player_idx if raised else None
     
-    def _handle_player_action(self, player_idx: int, current_bet: int, 
-                             providers: Dict, is_console: bool) -> tuple[int, Optional[int]]:
+    def _handle_player_action(self, player_idx: int, current_bet: int,
+                             provider: Callable[[PokerState, Player], str],
+                             is_console: bool) -> tuple[int, Optional[int]]:
         """
         Handle a single player's action.
         Returns (new_current_bet, last_raiser_idx or None)
         """
         player = self.game.players[player_idx]
-        provider = providers.get(player.player_num)
-        
+
         if is_console:
             self._print_action_header(player_idx, current_bet)
         
@@ -227,31 +212,21 @@ class BettingManager:
         action_valid = False
         new_current_bet = current_bet
         last_raiser = None
-        
+
         while not action_valid:
-            action = provider(self.game, player).lower()
-            
-            if action.startswith('fold'):
-                action_valid = self._process_fold(player, player_idx, is_console)
-            
-            elif action.startswith('check'):
-                action_valid = self._process_check(player, player_idx, current_bet, is_console)
-            
-            elif action.startswith('call'):
-                action_valid = self._process_call(player, player_idx, current_bet, is_console)
-            
-            elif action.startswith('allin'):
-                action_valid, new_current_bet, last_raiser = self._process_allin(
-                    player, player_idx, current_bet, is_console)
-            
-            elif action.startswith('raise'):
-                action_valid, new_current_bet, last_raiser = self._process_raise(
-                    action, player, player_idx, current_bet, is_console)
-            
-            else:
+            # Providers are contractually lowercase; only the console
+            # provider normalizes raw user input (see _get_console_provider)
+            action = provider(self.game, player)
+
+            handler = self._action_handlers.get(action.partition(' ')[0])
+            if handler is None:
                 if is_console:
                     print(f"Invalid action. Valid actions: fold, check, call, raise <amount>, allin\n")
-        
+                continue
+
+            action_valid, new_current_bet, last_raiser = handler(
+                action, player, player_idx, current_bet, is_console)
+
         return new_current_bet, last_raiser
     
     def _betting_round(self, starting_player_idx: int):
@@ -261,6 +236,8 @@ class BettingManager:
         providers = self._get_providers()
         is_console = self.action_providers is None
         num_players = len(self.game.players)
+        # Resolve each seat's provider once; seat order is stable for the round
+        providers_by_idx = [providers[p.player_num] for p in self.game.players]
         
         current_bet = self._get_current_bet()
         
@@ -275,73 +252,47 @@ class BettingManager:
                     self._print_round_summary()
             return winner
         
-        # Track who has acted this round
-        has_acted = {i: False for i in range(num_players)}
-        last_raiser_idx = None
-        
+        # Players who still owe an action this round. A player leaves the set
+        # by acting (fold/call/check/all-in) and everyone able to act re-enters
+        # when someone raises, so the round ends exactly when the set empties —
+        # no per-iteration rescan of the table. Unfolded players are counted
+        # separately for the last-player-standing check (only the acting
+        # player can fold, so a counter stays in sync).
+        pending = {i for i, p in enumerate(self.game.players)
+                   if not p.folded and p.chips.total() > 0}
+        active_count = sum(1 for p in self.game.players if not p.folded)
+
         idx = starting_player_idx
-        
+
         winner = None
-        while True:
-            player = self.game.players[idx]
-            
-            # Skip folded or all-in players
-            if player.folded or player.chips.total() == 0:
-                idx = (idx + 1) % num_players
-                
-                # Check termination: everyone has either acted and matched the bet, folded, or is all-in
-                all_done = all(
-                    p.folded or 
-                    p.chips.total() == 0 or 
-                    (has_acted[i] and p.bet == current_bet)
-                    for i, p in enumerate(self.game.players)
-                )
-                if all_done:
-                    break
-                continue
-            
-            # Skip if player has already acted and matched current bet (unless there was a raise after them)
-            if has_acted[idx] and player.bet == current_bet and (last_raiser_idx is None or idx != last_raiser_idx):
-                idx = (idx + 1) % num_players
-                
-                # Check termination
-                all_done = all(
-                    p.folded or 
-                    p.chips.total() == 0 or 
-                    (has_acted[i] and p.bet == current_bet)
-                    for i, p in enumerate(self.game.players)
-                )
-                if all_done:
+        while pending:
+            if idx in pending:
+                player = self.game.players[idx]
+
+                # Handle player action
+                new_bet, raiser_idx = self._handle_player_action(
+                    idx, current_bet, providers_by_idx[idx], is_console)
+
+                pending.discard(idx)
+
+                if player.folded:
+                    active_count -= 1
+
+                if raiser_idx is not None:
+                    # Raise (or over-the-top all-in) reopens action for every
+                    # other player still able to act; commit_bet already moved
+                    # game.current_bet
+                    current_bet = new_bet
+                    pending = {i for i, p in enumerate(self.game.players)
+                               if i != idx and not p.folded and p.chips.total() > 0}
+
+                # Check for immediate end: only one non-folded player
+                if active_count <= 1:
+                    winner = self._award_to_last_standing(is_console)
                     break
-                continue
-            
-            # Handle player action
-            new_bet, raiser_idx = self._handle_player_action(
-                idx, current_bet, providers, is_console)
-            
-            has_acted[idx] = True
-            
-            if raiser_idx is not None:
-                last_raiser_idx = raiser_idx
-                current_bet = new_bet
-            
-            # Check for immediate end: only one non-folded player
-            if len(self._get_active_players()) <= 1:
-                winner = self._award_to_last_standing(is_console)
-                break
-            
-            # Check termination: everyone has acted and matched the bet (or folded/all-in)
-            all_done = all(
-                p.folded or 
-                p.chips.total() == 0 or 
-                (has_acted[i] and p.bet == current_bet)
-                for i, p in enumerate(self.game.players)
-            )
-            if all_done:
-                break
-            
+
             idx = (idx + 1) % num_players
-        
+
         if is_console:
             self._print_round_summary()
 
@@ -363,10 +314,14 @@ class BettingManager:
         return providers
     
     def _get_console_provider(self) -> Callable[[PokerState, Player], str]:
-        """Returns a console input provider for local play."""
+        """Returns a console input provider for local play.
+
+        Action providers must return lowercase action strings; the console
+        provider lowercases here so typed input meets that contract.
+        """
         def console_provider(g: PokerState, p: Player) -> str:
             prompt = (f"Player {p.player_num} "
                      f"(chips={p.chips.total()}, bet={p.bet}) "
                      f"action [fold/check/call/raise <amt>/allin]: ")
-            return input(prompt).strip()
+            return input(prompt).strip().lower()
         return console_provider
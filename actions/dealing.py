@@ -1,26 +1,25 @@
-from models.game import PokerState
+from models.game import (PokerState, PHASE_PREFLOP, PHASE_FLOP,
+                         PHASE_TURN, PHASE_RIVER)
 '''
 Handles the four actions made by the dealer and updates
 the state of the game.
 '''
 def deal(game: PokerState):
-    for _ in range(2):
-        for player in game.players:
-            player.hand.append(game.deck.draw())
-    game.phase = 'preflop'
-            
-def flop(game: PokerState):
+    for player in game.players:
+        player.hand.extend(game.deck.draw_n(2))
+    game.phase = PHASE_PREFLOP
+
+def _deal_street(game: PokerState, phase: int, num_cards: int):
+    """Burn one card, deal num_cards to the board, and advance the phase."""
     game.burn_cards.append(game.deck.draw())
-    for _ in range(3):
-        game.community_cards.append(game.deck.draw())
-    game.state = 'flop'
+    game.community_cards.extend(game.deck.draw_n(num_cards))
+    game.phase = phase
+
+def flop(game: PokerState):
+    _deal_street(game, PHASE_FLOP, 3)
 
 def turn(game: PokerState):
-    game.burn_cards.append(game.deck.draw())
-    game.community_cards.append(game.deck.draw())
-    game.state='turn'
+    _deal_street(game, PHASE_TURN, 1)
 
 def river(game: PokerState):
-    game.burn_cards.append(game.deck.draw())
-    game.community_cards.append(game.deck.draw())
-    game.state='river'
+    _deal_street(game, PHASE_RIVER, 1)
@@ -1,5 +1,7 @@
-from collections import Counter
-from models.card import Card, Rank, Suit
+from bisect import insort
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from models.card import Card, Rank, Suit, RANK_PRIMES
 from typing import Optional, Dict, Callable
 from models.game import PokerState
 
@@ -35,7 +37,7 @@ class ShowdownManager:
         if len(active_players) == 1:
             winner = active_players[0]
             # If pot was already awarded earlier (e.g., during betting), skip re-awarding/printing
-            if getattr(self.game, '_pot_awarded', False):
+            if self.game._pot_awarded:
                 return [winner]
 
             pot_total = self.game.pot.total()
@@ -54,10 +56,9 @@ class ShowdownManager:
             # Not enough cards for hand evaluation (cards haven't been dealt yet)
             # Award pot equally to all active players
             pot_total = self.game.pot.total()
-            share = pot_total // len(active_players)
-            remainder = pot_total % len(active_players)
-            for i, player in enumerate(active_players):
-                amount = share + (1 if i < remainder else 0)
+            share, remainder = divmod(pot_total, len(active_players))
+            amounts = [share + 1] * remainder + [share] * (len(active_players) - remainder)
+            for player, amount in zip(active_players, amounts):
                 if amount > 0:
                     self.game.pot.transfer_to(player.chips, amount)
             if self.action_providers is None:
@@ -65,20 +66,22 @@ class ShowdownManager:
             return active_players
 
         # Multiple active players: evaluate hands and award pot
-        ranked = showdown(self.game)
-        winners = award_pot(self.game, ranked)
+        results = showdown(self.game)
+        winners = award_pot(self.game, results,
+                            quiet=self.action_providers is not None)
         return winners
 
 
 def showdown(game) -> list:
     """
-    Evaluate all active players' hands and return ranked winners.
-    
+    Evaluate all active players' hands.
+
     Args:
         game: PokerState object with players and community cards
-        
+
     Returns:
-        List of (player, hand_rank, hand_name) tuples, sorted from best to worst
+        List of (player, hand_rank, hand_name) tuples in seating order;
+        award_pot picks out the winners with a single max() scan
     """
     # Get all players who haven't folded
     active_players = [p for p in game.players if not p.folded]
@@ -86,46 +89,52 @@ def showdown(game) -> list:
     if len(active_players) == 0:
         raise ValueError("No active players for showdown")
     
-    # Evaluate each player's hand
+    # Evaluate each player's hand. The community cards are shared, so sort
+    # their packed codes once and only merge each player's hole cards in.
+    community_codes = sorted(card.int_value for card in game.community_cards)
+
     player_results = []
     for player in active_players:
-        # Combine player's hole cards with community cards
-        full_hand = player.hand + game.community_cards
-        hand_rank = evaluate_hand(full_hand)
+        codes = community_codes.copy()
+        for card in player.hand:
+            insort(codes, card.int_value)
+        if len(codes) < 5:
+            raise ValueError("Need at least 5 cards to evaluate")
+        hand_rank = _evaluate_hand_cached(tuple(codes))
         player_results.append((player, hand_rank, hand_name(hand_rank)))
-    
-    # Sort by hand rank (best first)
-    player_results.sort(key=lambda x: x[1], reverse=True)
-    
+
     return player_results
 
 
-def award_pot(game, ranked_results: list):
+def award_pot(game, results: list, quiet: bool = False):
     """
     Award the pot to the winner(s) based on showdown results.
     Handles split pots for ties.
-    
+
     Args:
         game: PokerState object
-        ranked_results: Output from showdown() function
+        results: Output from showdown() function (any order)
+        quiet: Suppress per-winner prints (simulation runs; console play
+            passes False, matching ShowdownManager's other print sites)
     """
-    if not ranked_results:
+    if not results:
         raise ValueError("No players to award pot to")
+
+    # Single O(N) pass for the best rank, then collect ties; most hands have
+    # one winner so this beats a full sort of the results
+    best_hand_rank = max(result[1] for result in results)
+    winners = [result for result in results if result[1] == best_hand_rank]
     
-    # Find all players with the best hand (in case of tie)
-    best_hand_rank = ranked_results[0][1]
-    winners = [result for result in ranked_results if result[1] == best_hand_rank]
-    
-    # Calculate pot share
+    # Calculate pot shares up front: first `remainder` winners get the odd chip
     pot_total = game.pot.total()
-    pot_share = pot_total // len(winners)
-    remainder = pot_total % len(winners)
-    
+    pot_share, remainder = divmod(pot_total, len(winners))
+    amounts = [pot_share + 1] * remainder + [pot_share] * (len(winners) - remainder)
+
     # Award chips to winners
-    for i, (player, hand_rank, hand_name_str) in enumerate(winners):
-        amount = pot_share + (1 if i < remainder else 0)
+    for (player, hand_rank, hand_name_str), amount in zip(winners, amounts):
         game.pot.transfer_to(player.chips, amount)
-        print(f"Player {player.player_num} wins ${amount} with {hand_name_str}")
+        if not quiet:
+            print(f"Player {player.player_num} wins ${amount} with {hand_name_str}")
     
     return [player for player, _, _ in winners]
 
@@ -141,109 +150,252 @@ def evaluate_hand(cards: list[Card]) -> tuple:
     """
     if len(cards) < 5:
         raise ValueError("Need at least 5 cards to evaluate")
-    
-    # Get all possible 5-card combinations and find the best
-    from itertools import combinations
+
+    # Canonical key: suit-agnostic ordering of the packed card codes so the
+    # same 7 cards hit the cache no matter how the lists were assembled
+    cards_key = tuple(sorted(card.int_value for card in cards))
+    return _evaluate_hand_cached(cards_key)
+
+
+@lru_cache(maxsize=1_048_576)
+def _evaluate_hand_cached(cards_key: tuple) -> tuple:
+    """
+    Evaluate the best 5-card hand for a sorted tuple of packed
+    Card.int_value codes.
+
+    Cached because showdowns and simulations repeatedly evaluate hands
+    sharing the same community cards; repeats become a single dict hit.
+    """
+    if len(cards_key) == 7:
+        # One linear scan collects everything the fast paths need: per-suit
+        # rank bitmasks and the 7-rank prime product. Ranks within a suit
+        # are distinct, so a mask's popcount is that suit's card count.
+        suit_masks = [0] * 9
+        prime_product = 1
+        for c in cards_key:
+            suit_masks[(c >> 12) & 0xF] |= c >> 16
+            prime_product *= c & 0xFF
+
+        for suit_bit in (1, 2, 4, 8):
+            if suit_masks[suit_bit].bit_count() >= 5:
+                # With 5+ suited cards no full house or quads is possible,
+                # so the best hand is always the best flush in that suit
+                return _FLUSH7_LOOKUP[suit_masks[suit_bit]]
+
+        # Non-flush: no 5-card subset can be single-suited, so only the
+        # unsuited table matters and the result depends purely on ranks.
+        # Cache by the suit-independent prime product of all 7 ranks.
+        best_hand = _RANK7_CACHE.get(prime_product)
+        if best_hand is None:
+            p0, p1, p2, p3, p4, p5, p6 = [c & 0xFF for c in cards_key]
+            best_hand = _best_unsuited_of_7(p0, p1, p2, p3, p4, p5, p6)
+            _RANK7_CACHE[prime_product] = best_hand
+        return best_hand
+
+    # Generic path for hands that are not exactly 7 cards
     best_hand = None
-    
-    for five_cards in combinations(cards, 5):
-        hand_value = _evaluate_five_cards(list(five_cards))
+
+    for five_cards in combinations(cards_key, 5):
+        c0, c1, c2, c3, c4 = five_cards
+        key = (c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF)
+        if c0 & c1 & c2 & c3 & c4 & 0xF000:
+            hand_value = _FLUSH_LOOKUP[key]
+        else:
+            hand_value = _UNSUITED_LOOKUP[key]
         if best_hand is None or hand_value > best_hand:
             best_hand = hand_value
-    
+
     return best_hand
 
 
-def _evaluate_five_cards(cards: list[Card]) -> tuple:
-    """Evaluate exactly 5 cards and return their rank."""
-    ranks = sorted([card.rank.value for card in cards], reverse=True)
-    suits = [card.suit for card in cards]
-    rank_counts = Counter(ranks)
-    
-    is_flush = len(set(suits)) == 1
+def _best_unsuited_of_7(p0: int, p1: int, p2: int, p3: int, p4: int,
+                        p5: int, p6: int) -> tuple:
+    """Best unsuited rank over the 21 five-of-seven prime subsets, unrolled."""
+    t = _UNSUITED_LOOKUP
+    return max(
+        t[p0 * p1 * p2 * p3 * p4], t[p0 * p1 * p2 * p3 * p5],
+        t[p0 * p1 * p2 * p3 * p6], t[p0 * p1 * p2 * p4 * p5],
+        t[p0 * p1 * p2 * p4 * p6], t[p0 * p1 * p2 * p5 * p6],
+        t[p0 * p1 * p3 * p4 * p5], t[p0 * p1 * p3 * p4 * p6],
+        t[p0 * p1 * p3 * p5 * p6], t[p0 * p1 * p4 * p5 * p6],
+        t[p0 * p2 * p3 * p4 * p5], t[p0 * p2 * p3 * p4 * p6],
+        t[p0 * p2 * p3 * p5 * p6], t[p0 * p2 * p4 * p5 * p6],
+        t[p0 * p3 * p4 * p5 * p6], t[p1 * p2 * p3 * p4 * p5],
+        t[p1 * p2 * p3 * p4 * p6], t[p1 * p2 * p3 * p5 * p6],
+        t[p1 * p2 * p4 * p5 * p6], t[p1 * p3 * p4 * p5 * p6],
+        t[p2 * p3 * p4 * p5 * p6],
+    )
+
+
+def _evaluate_five_cards(ranks: list[int], suits: list[int]) -> tuple:
+    """
+    Evaluate exactly 5 cards and return their rank.
+
+    Operates on parallel lists of plain ints (rank values 2-14 and suit
+    codes) rather than Card objects, so callers pay no attribute/enum
+    lookups inside the evaluation itself.
+    """
+    ranks = sorted(ranks, reverse=True)
+
+    is_flush = suits[0] == suits[1] == suits[2] == suits[3] == suits[4]
     is_straight = _is_straight(ranks)
-    
-    # Count rank frequencies
-    counts = sorted(rank_counts.values(), reverse=True)
-    unique_ranks = sorted(rank_counts.keys(), key=lambda r: (rank_counts[r], r), reverse=True)
-    
-    # Straight Flush
-    if is_straight and is_flush:
-        return (9, max(ranks))
-    
-    # Four of a Kind
-    if counts == [4, 1]:
-        four_kind = [r for r, c in rank_counts.items() if c == 4][0]
-        kicker = [r for r, c in rank_counts.items() if c == 1][0]
-        return (8, four_kind, kicker)
-    
-    # Full House
-    if counts == [3, 2]:
-        three_kind = [r for r, c in rank_counts.items() if c == 3][0]
-        pair = [r for r, c in rank_counts.items() if c == 2][0]
-        return (7, three_kind, pair)
-    
-    # Flush
+
+    # Flush/straight fast path: both imply five distinct ranks, so no quads
+    # or full house can outrank them and the count pass below is unnecessary
     if is_flush:
+        if is_straight:
+            return (9, ranks[0])
         return (6, *ranks)
-    
-    # Straight
     if is_straight:
-        return (5, max(ranks))
-    
+        return (5, ranks[0])
+
+    # Count rank frequencies into a fixed 15-slot array (index = rank value)
+    # and extract the hand shape in one descending pass — no dict, no rescans
+    cnt = [0] * 15
+    for r in ranks:
+        cnt[r] += 1
+
+    four = three = -1
+    pairs = []
+    kickers = []
+    for r in range(14, 1, -1):
+        c = cnt[r]
+        if c == 0:
+            continue
+        if c == 4:
+            four = r
+        elif c == 3:
+            three = r
+        elif c == 2:
+            pairs.append(r)
+        else:
+            kickers.append(r)
+
+    # Four of a Kind
+    if four >= 0:
+        return (8, four, kickers[0])
+
+    # Full House
+    if three >= 0 and pairs:
+        return (7, three, pairs[0])
+
     # Three of a Kind
-    if counts == [3, 1, 1]:
-        three_kind = [r for r, c in rank_counts.items() if c == 3][0]
-        kickers = sorted([r for r, c in rank_counts.items() if c == 1], reverse=True)
-        return (4, three_kind, *kickers)
-    
+    if three >= 0:
+        return (4, three, *kickers)
+
     # Two Pair
-    if counts == [2, 2, 1]:
-        pairs = sorted([r for r, c in rank_counts.items() if c == 2], reverse=True)
-        kicker = [r for r, c in rank_counts.items() if c == 1][0]
-        return (3, pairs[0], pairs[1], kicker)
-    
+    if len(pairs) == 2:
+        return (3, pairs[0], pairs[1], kickers[0])
+
     # One Pair
-    if counts == [2, 1, 1, 1]:
-        pair = [r for r, c in rank_counts.items() if c == 2][0]
-        kickers = sorted([r for r, c in rank_counts.items() if c == 1], reverse=True)
-        return (2, pair, *kickers)
-    
+    if pairs:
+        return (2, pairs[0], *kickers)
+
     # High Card
     return (1, *ranks)
 
 
+# The ten straights as 13-bit rank masks (bit 0 = deuce), including the
+# A-2-3-4-5 wheel
+_STRAIGHT_MASKS = frozenset(0b11111 << i for i in range(9)) | {0b1000000001111}
+
+
 def _is_straight(ranks: list[int]) -> bool:
     """Check if ranks form a straight."""
-    ranks_sorted = sorted(ranks)
-    
-    # Check regular straight
-    if ranks_sorted == list(range(ranks_sorted[0], ranks_sorted[0] + 5)):
-        return True
-    
-    # Check for A-2-3-4-5 (wheel) straight
-    if ranks_sorted == [2, 3, 4, 5, 14]:
-        return True
-    
-    return False
+    mask = 0
+    for r in ranks:
+        mask |= 1 << (r - 2)
+    return mask in _STRAIGHT_MASKS
+
+
+# Prime code for each rank value (2..14), shared with Card.int_value
+# packing. The product of five rank primes uniquely identifies a 5-card
+# rank multiset, so it can key a lookup table.
+_RANK_PRIMES = [0, 0] + list(RANK_PRIMES)
+
+
+def _build_lookup_tables() -> tuple[dict[int, tuple], dict[int, tuple]]:
+    """
+    Build the prime-product lookup tables used by `evaluate_hand`.
+
+    Every 5-card hand is fully determined by its rank multiset plus whether
+    it is a flush, so we precompute one table for flush hands and one for
+    everything else, both keyed by the product of the five rank primes.
+    Tables are generated once at import from `_evaluate_five_cards`, so a
+    lookup returns exactly the tuple the direct evaluation would.
+
+    Returns:
+        (flush_lookup, unsuited_lookup) dictionaries
+    """
+    flush_lookup = {}
+    unsuited_lookup = {}
+
+    # Flushes (including straight flushes): 5 distinct ranks, one suit
+    for ranks in combinations(range(2, 15), 5):
+        key = 1
+        for r in ranks:
+            key *= _RANK_PRIMES[r]
+        flush_lookup[key] = _evaluate_five_cards(list(ranks), [0] * 5)
+
+    # Everything else: any rank multiset with at most 4 of a rank, mixed suits
+    for ranks in combinations_with_replacement(range(2, 15), 5):
+        # combinations_with_replacement yields sorted tuples, so five of a
+        # kind is simply first == last
+        if ranks[0] == ranks[4]:
+            continue
+        key = 1
+        for r in ranks:
+            key *= _RANK_PRIMES[r]
+        unsuited_lookup[key] = _evaluate_five_cards(list(ranks), [0, 1, 2, 3, 0])
+
+    return flush_lookup, unsuited_lookup
+
+
+def _build_flush_mask_table() -> dict[int, tuple]:
+    """
+    Build the table mapping a suit's 13-bit rank mask (5 to 7 bits set)
+    to the best 5-card flush available from those ranks.
+    """
+    table = {}
+    # All 5-card flushes, evaluated directly
+    for bits in combinations(range(13), 5):
+        mask = 0
+        for b in bits:
+            mask |= 1 << b
+        table[mask] = _evaluate_five_cards([b + 2 for b in bits], [0] * 5)
+
+    # 6- and 7-card suit masks: best of their 5-bit submasks
+    for count in (6, 7):
+        for bits in combinations(range(13), count):
+            mask = 0
+            for b in bits:
+                mask |= 1 << b
+            table[mask] = max(
+                table[sum(1 << b for b in sub)]
+                for sub in combinations(bits, 5)
+            )
+    return table
+
+
+_FLUSH_LOOKUP, _UNSUITED_LOOKUP = _build_lookup_tables()
+_FLUSH7_LOOKUP = _build_flush_mask_table()
+
+# Lazily-populated cache: product of all 7 rank primes -> best non-flush
+# rank tuple. Suit-independent, so distinct deals collapse onto few keys.
+_RANK7_CACHE: dict[int, tuple] = {}
+
+
+# Indexed by hand type (hand_rank[0]); slot 0 is unused
+_HAND_NAMES = ("Unknown", "High Card", "One Pair", "Two Pair",
+               "Three of a Kind", "Straight", "Flush", "Full House",
+               "Four of a Kind", "Straight Flush")
 
 
 def hand_name(hand_rank: tuple) -> str:
     """Convert hand rank tuple to readable name."""
     hand_type = hand_rank[0]
-    
-    names = {
-        9: "Straight Flush",
-        8: "Four of a Kind",
-        7: "Full House",
-        6: "Flush",
-        5: "Straight",
-        4: "Three of a Kind",
-        3: "Two Pair",
-        2: "One Pair",
-        1: "High Card"
-    }
-    
-    return names.get(hand_type, "Unknown")
+    if 0 <= hand_type < len(_HAND_NAMES):
+        return _HAND_NAMES[hand_type]
+    return "Unknown"
 
 
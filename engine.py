@@ -1,6 +1,6 @@
 from models.card import Suit, Rank, Card, Deck
 from models.chip import ChipHolder, Chip
-from models.game import PokerState
+from models.game import PokerState, PHASE_PREFLOP
 from models.player import Player
 from typing import Callable, Dict, Optional
 import actions.dealing as dealing
@@ -33,6 +33,7 @@ class PokerEngine:
         if num_players > 22:
             raise ValueError('Too many players')
         
+        self.num_players = num_players
         self.chip_breakdown = chip_breakdown
         self.game = self._initialize_game(num_players, blind_amount, chip_breakdown, denominations)
         self.action_providers: Optional[Dict[int, Callable[[PokerState, Player], str]]] = None
@@ -52,7 +53,7 @@ class PokerEngine:
         Avoids concurrent modification by creating a fresh dict each time.
 
         Args:
-            provider: A callable that takes (game: PokerState, player: Player) and returns an action string
+            provider: A callable that takes (game: PokerState, player: Player) and returns a lowercase action string
         """
         providers = {p.player_num: provider for p in self.game.players}
         self.set_action_providers(providers)
@@ -62,7 +63,7 @@ class PokerEngine:
 
         Args:
             player_num: The player number to add/update
-            provider: A callable that takes (game: PokerState, player: Player) and returns an action string
+            provider: A callable that takes (game: PokerState, player: Player) and returns a lowercase action string
         """
         if self.action_providers is None:
             self.action_providers = {}
@@ -78,7 +79,7 @@ class PokerEngine:
 
         Args:
             player_num: The player number to set
-            provider: A callable that takes (game: PokerState, player: Player) and returns an action string
+            provider: A callable that takes (game: PokerState, player: Player) and returns a lowercase action string
         """
         self.add_action_provider(player_num, provider)
     
@@ -99,46 +100,32 @@ class PokerEngine:
     def run(self):
         """Run a full hand (deal, betting rounds, community cards, showdown, cleanup).
 
-        Returns list of winner Player objects (one or many if split pot).
+        Returns the winners' seat numbers (one or many if split pot), captured
+        before next-round cleanup removes broke players and renumbers seats.
         """
-        # Deal hole cards and run preflop betting
-        self.deal()
-        winner = self.preflop_betting_round()
-        if winner is not None:
-            winners = [winner]
-            self.next_round()
-            return winners
-
-        # Flop
-        self.flop()
-        winner = self.postflop_betting_round()
-        if winner is not None:
-            winners = [winner]
-            self.next_round()
-            return winners
-
-        # Turn
-        self.turn()
-        winner = self.postflop_betting_round()
-        if winner is not None:
-            winners = [winner]
-            self.next_round()
-            return winners
-
-        # River
-        self.river()
-        winner = self.postflop_betting_round()
-        if winner is not None:
-            winners = [winner]
-            self.next_round()
-            return winners
+        # Each street is a (dealing step, betting round) pair; the hand ends
+        # early as soon as a betting round produces a winner
+        streets = (
+            (self.deal, self.preflop_betting_round),
+            (self.flop, self.postflop_betting_round),
+            (self.turn, self.postflop_betting_round),
+            (self.river, self.postflop_betting_round),
+        )
+        for deal_step, betting_round in streets:
+            deal_step()
+            winner = betting_round()
+            if winner is not None:
+                winner_nums = [winner.player_num]
+                self.next_round()
+                return winner_nums
 
         # Showdown
         winners = self.showdown()
+        winner_nums = [p.player_num for p in winners]
 
         # Prepare for next round
         self.next_round()
-        return winners
+        return winner_nums
 
     def showdown(self) -> list:
         """
@@ -168,9 +155,44 @@ class PokerEngine:
         # Advance dealer to next player
         self.game.advance_dealer()
 
-        # Reshuffle deck if it's getting low (fewer than 20 cards left)
+        # Reshuffle deck if it's getting low (fewer than 20 cards left);
+        # normally unreachable since reset_round_state already reset it
         if len(self.game.deck.cards) < 20:
-            self.game.deck = Deck()
+            self.game.deck.reset()
+
+    def reset(self):
+        """Restore the engine to a fresh game with the original player count
+        and starting stacks, reusing the engine, state and deck objects.
+
+        Lets long simulation loops run many games on one engine instead of
+        constructing a new PokerEngine (and its 52-card deck, players and
+        chip holders) per game.
+        """
+        game = self.game
+        template = ChipHolder(self.chip_breakdown)
+
+        if len(game.players) == self.num_players:
+            # Reuse the existing Player objects
+            for i, p in enumerate(game.players):
+                p.player_num = i
+                p.chips = template.copy()
+                p.hand = []
+                p.folded = False
+                p.bet = 0
+        else:
+            # Some players busted out last game; rebuild the table
+            game.players = [Player(player_num=i, chips=template.copy())
+                            for i in range(self.num_players)]
+
+        game.pot = ChipHolder()
+        game.community_cards = []
+        game.burn_cards = []
+        game.dealer_index = 0
+        game.current_player = 1
+        game.phase = PHASE_PREFLOP
+        game.current_bet = 0
+        game._pot_awarded = False
+        game.deck.reset()
 
     # No checks on the state of the game, perhaps something that needs to be done but probably not
     def flop(self):
@@ -201,10 +223,10 @@ class PokerEngine:
     def _initialize_game(self, num_players: int, blind_amount: int, 
                         chip_breakdown: dict, denominations: list) -> PokerState:
         """Create and initialize the game state."""
-        players = []
-        for i in range(num_players):
-            player = Player(player_num=i, chips=ChipHolder(chip_breakdown))
-            players.append(player)
+        # All players start with identical stacks: build one holder and copy it
+        template = ChipHolder(chip_breakdown)
+        players = [Player(player_num=i, chips=template.copy())
+                   for i in range(num_players)]
         
         game = PokerState(
             blind_amount=blind_amount,
@@ -215,7 +237,7 @@ class PokerEngine:
             dealer_index=0,
             current_player=1,
             deck=Deck(),
-            phase="preflop"
+            phase=PHASE_PREFLOP
         )
         
         return game
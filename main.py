@@ -1,10 +1,43 @@
+import os
+from multiprocessing import Pool
+
 from engine import PokerEngine
 from AP.action_providers import call_AP, fold_AP, allin_AP, random_choice_AP
+from models.card import reseed_deck_rng
+
+NUM_GAMES = 100
+NUM_PLAYERS = 22
+
+
+def _run_games(num_games: int):
+    """Run a batch of games on one reused engine (see PokerEngine.reset);
+    games share no state across workers."""
+    engine = PokerEngine(num_players=NUM_PLAYERS)
+    engine.set_global_action_provider(random_choice_AP)
+    winner_nums_per_game = []
+    for _ in range(num_games):
+        winner_nums_per_game.append(engine.run())
+        engine.reset()
+    return winner_nums_per_game
 
-# Simple initialization with defaults
 
+if __name__ == '__main__':
+    # Games are independent, so spread them across one worker per core
+    workers = os.cpu_count() or 1
+    counts = [NUM_GAMES // workers] * workers
+    for i in range(NUM_GAMES % workers):
+        counts[i] += 1
+    # Reseed each worker's deck generator; forked workers would otherwise
+    # share the parent's RNG state and replay identical shuffles
+    with Pool(workers, initializer=reseed_deck_rng) as pool:
+        results = pool.map(_run_games, counts)
+        # Let workers flush buffered stdout before the context terminates them
+        pool.close()
+        pool.join()
 
-for _ in range(100):
-    game = PokerEngine(num_players=22)
-    game.set_global_action_provider(random_choice_AP)
-    game.run()
+    # Report winners from the parent so output survives redirection
+    game_num = 0
+    for batch in results:
+        for winner_nums in batch:
+            game_num += 1
+            print(f"Game {game_num}: winner(s) {', '.join(map(str, winner_nums))}")
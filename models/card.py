@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import random
 
@@ -23,10 +23,34 @@ class Rank(Enum):
     KING = 13
     ACE = 14
 
-@dataclass(frozen=True)
+_SUIT_CODES = {suit: i for i, suit in enumerate(Suit)}
+
+# Prime code per rank index (deuce through ace); products of these uniquely
+# identify rank multisets in the hand evaluator
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+@dataclass(frozen=True, slots=True)
 class Card:
     rank: Rank
     suit: Suit
+    # Plain-int mirrors of rank/suit cached at construction so hot paths
+    # (hand evaluation, cache keys) skip enum attribute lookups
+    rank_value: int = field(init=False, repr=False, compare=False)
+    suit_code: int = field(init=False, repr=False, compare=False)
+    # Packed evaluator code: rank bit << 16 | suit bit << 12 |
+    # rank index << 8 | rank prime (Cactus Kev layout)
+    int_value: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        rank_value = self.rank.value
+        suit_code = _SUIT_CODES[self.suit]
+        rank_idx = rank_value - 2
+        object.__setattr__(self, 'rank_value', rank_value)
+        object.__setattr__(self, 'suit_code', suit_code)
+        object.__setattr__(self, 'int_value',
+                           (1 << (16 + rank_idx)) | (1 << (12 + suit_code)) |
+                           (rank_idx << 8) | RANK_PRIMES[rank_idx])
+
     def __repr__(self) -> str:
         """Return a compact human-friendly representation like 'A♥' or '10♦'."""
         suit_symbols = {
@@ -47,14 +71,50 @@ class Card:
         return f"{rank_str}{suit_symbols.get(self.suit, self.suit.value)}"
 
 
+# Dedicated generator for deck shuffles: module-level random.shuffle goes
+# through the lock-guarded global Mersenne Twister, a bound method on our own
+# instance does not
+_deck_rng = random.Random()
+
+
+def reseed_deck_rng(seed=None) -> None:
+    """Reseed the deck-shuffle generator (from OS entropy by default).
+
+    Forked worker processes inherit _deck_rng's state verbatim (only the
+    global random module is reseeded by multiprocessing), so pool workers
+    must call this once at startup or they all deal identical shuffles.
+    """
+    _deck_rng.seed(seed)
+
+
+# All 52 cards, built once at import. Card is immutable, so decks, tests and
+# callers can share these objects instead of constructing their own.
+CARDS = tuple(
+    Card(rank, suit)
+    for suit in Suit
+    for rank in Rank
+)
+
+# Lookup for the canonical instance of a given rank and suit
+CARD_BY_RANK_SUIT = {(card.rank, card.suit): card for card in CARDS}
+
+
 class Deck:
     def __init__(self):
-        self.cards = [
-            Card(rank, suit)
-            for suit in Suit
-            for rank in Rank
-        ]
-        random.shuffle(self.cards)
+        self.cards = list(CARDS)
+        _deck_rng.shuffle(self.cards)
+
+    def reset(self):
+        """Restore all 52 cards and shuffle, reusing the shared Card objects."""
+        self.cards = list(CARDS)
+        _deck_rng.shuffle(self.cards)
 
     def draw(self) -> Card:
-        return self.cards.pop()
\ No newline at end of file
+        return self.cards.pop()
+
+    def draw_n(self, n: int) -> list[Card]:
+        """Draw n cards at once, in the same order n single draws would yield."""
+        drawn = self.cards[-n:]
+        drawn.reverse()
+        del self.cards[-n:]
+        return drawn
\ No newline at end of file
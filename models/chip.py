@@ -1,8 +1,37 @@
 from __future__ import annotations
+from bisect import insort
 from dataclasses import dataclass
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=4096)
+def _greedy_transfer(amount: int, values: Tuple[int, ...],
+                     quantities: Tuple[int, ...]) -> Optional[Tuple[Tuple[int, int], ...]]:
+    """Greedy largest-first chip selection for `amount`.
+
+    `values` are the held chip values in descending order with `quantities`
+    parallel to them. Returns ((value, count), ...) pairs, or None when exact
+    change cannot be made. Pure in its arguments, so results are memoized:
+    blinds and call amounts repeat heavily across simulated hands.
+    """
+    remaining = amount
+    transfer = []
+
+    for value, available in zip(values, quantities):
+        needed = remaining // value
+        if needed > 0:
+            count = min(needed, available)
+            transfer.append((value, count))
+            remaining -= count * value
+            if remaining == 0:
+                break
+
+    if remaining > 0:
+        return None
+    return tuple(transfer)
+
+
+@dataclass(frozen=True, slots=True)
 class Chip:
     value: int
 
@@ -14,6 +43,8 @@ class ChipHolder:
     A class that maps chip values to quantities.
     Used by players for their stacks and for the pot.
     """
+    __slots__ = ('chips', 'denominations', '_total', '_sorted_values')
+
     def __init__(self, chips: Dict[int, int] = None, denominations: list = None):
         """
         Initialize a ChipHolder.
@@ -25,22 +56,30 @@ class ChipHolder:
         """
         self.chips = chips.copy() if chips else {}
         self.denominations = sorted(denominations) if denominations else [1]
+        # Running total, maintained by add_chips/remove_chips so total() is O(1)
+        self._total = sum(value * qty for value, qty in self.chips.items())
+        # Chip values currently held, ascending; maintained alongside the dict
+        # so transfer/exchange paths never re-sort the keys
+        self._sorted_values = sorted(self.chips)
     
     def add_chips(self, value: int, quantity: int) -> None:
         """Add chips of a specific value."""
-        if value <= 0:
-            raise ValueError("Chip value must be positive")
-        if quantity < 0:
-            raise ValueError("Quantity cannot be negative")
+        # Caller bugs, not runtime conditions; stripped under python -O
+        assert value > 0, "Chip value must be positive"
+        assert quantity >= 0, "Quantity cannot be negative"
         if quantity == 0:
             return
         
-        self.chips[value] = self.chips.get(value, 0) + quantity
+        if value in self.chips:
+            self.chips[value] += quantity
+        else:
+            self.chips[value] = quantity
+            insort(self._sorted_values, value)
+        self._total += value * quantity
     
     def remove_chips(self, value: int, quantity: int) -> None:
         """Remove chips of a specific value."""
-        if quantity < 0:
-            raise ValueError("Quantity cannot be negative")
+        assert quantity >= 0, "Quantity cannot be negative"
         if quantity == 0:
             return
         
@@ -51,6 +90,8 @@ class ChipHolder:
         self.chips[value] -= quantity
         if self.chips[value] == 0:
             del self.chips[value]
+            self._sorted_values.remove(value)
+        self._total -= value * quantity
     
     def transfer_to(self, other: ChipHolder, amount: int) -> None:
         """
@@ -64,12 +105,9 @@ class ChipHolder:
         Raises:
             ValueError: If insufficient chips
         """
-        if not isinstance(other, ChipHolder):
-            raise TypeError("Can only transfer chips to another ChipHolder")
-        
-        if amount < 0:
-            raise ValueError("Amount must be non-negative")
-        
+        assert isinstance(other, ChipHolder), "Can only transfer chips to another ChipHolder"
+        assert amount >= 0, "Amount must be non-negative"
+
         if amount == 0:
             return
         
@@ -79,42 +117,81 @@ class ChipHolder:
         # Keep trying to transfer, exchanging with bank if needed
         max_attempts = 100  # Prevent infinite loops
         attempts = 0
-        
+        dp_tried = False
+
         while attempts < max_attempts:
             try:
                 chips_to_transfer = self._calculate_chip_transfer(amount)
-                # Successfully calculated the transfer
-                for value, quantity in chips_to_transfer.items():
-                    self.remove_chips(value, quantity)
-                    other.add_chips(value, quantity)
-                return
             except ValueError:
-                # Can't make exact change, exchange with bank
-                self._exchange_with_bank(amount)
-                attempts += 1
-        
+                # Greedy failed; a full coin-change search may still find an
+                # exact combination of held chips without touching the bank.
+                # Run it at most once per call: if no combination exists, the
+                # DP would otherwise be repeated on every exchange retry and
+                # turn unmakeable amounts into a multi-second failure path
+                chips_to_transfer = None if dp_tried else self._exact_change(amount)
+                dp_tried = True
+                if chips_to_transfer is None:
+                    # No exact combination found: break a chip with the bank
+                    self._exchange_with_bank(amount)
+                    attempts += 1
+                    continue
+
+            for value, quantity in chips_to_transfer.items():
+                self.remove_chips(value, quantity)
+                other.add_chips(value, quantity)
+            return
+
         raise ValueError(f"Could not transfer {amount} after {max_attempts} bank exchanges")
     
     def _calculate_chip_transfer(self, amount: int) -> Dict[int, int]:
         """Calculate which chips to use for a transfer (greedy algorithm)."""
-        remaining = amount
-        chips_to_transfer = {}
-        
-        # Use largest chips first
-        for value in sorted(self.chips.keys(), reverse=True):
-            available = self.chips[value]
-            needed = remaining // value
-            
-            if needed > 0:
-                transfer_count = min(needed, available)
-                chips_to_transfer[value] = transfer_count
-                remaining -= transfer_count * value
-        
-        if remaining > 0:
+        # Single chip covering the exact amount: skip tuple building and hashing
+        if self.chips.get(amount, 0) > 0:
+            return {amount: 1}
+
+        values = tuple(reversed(self._sorted_values))
+        quantities = tuple(self.chips[v] for v in values)
+        transfer = _greedy_transfer(amount, values, quantities)
+
+        if transfer is None:
             raise ValueError(f"Cannot make exact change for {amount} with available chips")
-        
-        return chips_to_transfer
+
+        return dict(transfer)
     
+    def _exact_change(self, amount: int) -> Optional[Dict[int, int]]:
+        """Find held chips summing exactly to `amount` by coin-change DP.
+
+        The greedy pass can miss combinations (e.g. paying 75 from {25: 3,
+        100: 1} after greedy grabs the 100), which previously triggered up to
+        100 bank-exchange retries. The DP is O(amount x chip count) and only
+        runs when greedy fails. Returns {value: quantity} or None when no
+        exact combination exists.
+        """
+        if amount > 10_000:
+            return None
+
+        # dp[v] holds the chip value used to first reach sum v (0 = start)
+        dp: list = [None] * (amount + 1)
+        dp[0] = 0
+        for value, qty in self.chips.items():
+            # Treat each physical chip separately; iterating downward keeps
+            # any single chip from being reused within one pass
+            for _ in range(min(qty, amount // value)):
+                for v in range(amount, value - 1, -1):
+                    if dp[v] is None and dp[v - value] is not None:
+                        dp[v] = value
+
+        if dp[amount] is None:
+            return None
+
+        change: Dict[int, int] = {}
+        v = amount
+        while v > 0:
+            value = dp[v]
+            change[value] = change.get(value, 0) + 1
+            v -= value
+        return change
+
     def _exchange_with_bank(self, amount: int) -> None:
         """
         Exchange chips with the bank to get smaller denominations.
@@ -125,7 +202,7 @@ class ChipHolder:
         """
         # Find the smallest chip denomination that we can break down
         # We want to exchange a large chip for smaller ones to make exact change
-        for chip_value in sorted(self.chips.keys(), reverse=True):
+        for chip_value in reversed(self._sorted_values):
             if self.chips[chip_value] > 0 and chip_value > amount:
                 # This chip is larger than what we need, we can break it down
                 self.remove_chips(chip_value, 1)
@@ -135,7 +212,7 @@ class ChipHolder:
                 return
         
         # If no chip is larger than amount, exchange the largest chip we have
-        largest_chip = max(self.chips.keys())
+        largest_chip = self._sorted_values[-1]
         if self.chips[largest_chip] > 0:
             self.remove_chips(largest_chip, 1)
             break_down = self._calculate_breakdown(largest_chip)
@@ -156,12 +233,18 @@ class ChipHolder:
         breakdown = {}
         remaining = chip_value
         
-        # Use largest available denominations first (excluding the chip_value itself)
-        for denom in sorted([d for d in self.denominations if d < chip_value], reverse=True):
+        # Use largest available denominations first (excluding the chip_value
+        # itself); denominations is kept sorted ascending, so walk it backwards
+        # instead of filtering and re-sorting per call
+        for denom in reversed(self.denominations):
+            if denom >= chip_value:
+                continue
             if remaining >= denom:
                 count = remaining // denom
                 breakdown[denom] = count
                 remaining -= count * denom
+                if remaining == 0:
+                    break
         
         # If there's a remainder, use the smallest denomination
         if remaining > 0:
@@ -172,20 +255,40 @@ class ChipHolder:
     
     def transfer_all_to(self, other: ChipHolder) -> None:
         """Transfer all chips to another ChipHolder."""
-        if not isinstance(other, ChipHolder):
-            raise TypeError("Can only transfer chips to another ChipHolder")
-        
-        for value, quantity in list(self.chips.items()):
-            other.add_chips(value, quantity)
-            self.remove_chips(value, quantity)
+        assert isinstance(other, ChipHolder), "Can only transfer chips to another ChipHolder"
+
+        # Merge straight into the other holder's dict and empty this one
+        # wholesale: no snapshot list, no per-denomination remove_chips calls
+        for value, quantity in self.chips.items():
+            if value in other.chips:
+                other.chips[value] += quantity
+            else:
+                other.chips[value] = quantity
+                insort(other._sorted_values, value)
+        other._total += self._total
+        self.chips.clear()
+        self._sorted_values.clear()
+        self._total = 0
     
     def total(self) -> int:
-        """Calculate total value of all chips."""
-        return sum(value * qty for value, qty in self.chips.items())
+        """Total value of all chips (maintained incrementally)."""
+        return self._total
     
     def copy(self) -> 'ChipHolder':
-        """Create a deep copy of this ChipHolder."""
-        return ChipHolder(self.chips, self.denominations)
+        """Create a deep copy of this ChipHolder.
+
+        Bypasses __init__: the source holder's state is already validated and
+        its cached total/sorted values can be copied straight across, which
+        matters when stamping out per-player stacks from one template.
+        """
+        new = ChipHolder.__new__(ChipHolder)
+        new.chips = self.chips.copy()
+        new.denominations = self.denominations[:]
+        new._total = self._total
+        new._sorted_values = self._sorted_values[:]
+        return new
+
+    __copy__ = copy
     
     def is_empty(self) -> bool:
         """Check if this ChipHolder has no chips."""
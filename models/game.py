@@ -4,8 +4,12 @@ from models.player import Player
 from models.card import Deck, Card
 from models.chip import ChipHolder
 
+# Game phases as small ints; PHASE_NAMES maps them back for display
+PHASE_PREFLOP, PHASE_FLOP, PHASE_TURN, PHASE_RIVER, PHASE_SHOWDOWN = range(5)
+PHASE_NAMES = ("preflop", "flop", "turn", "river", "showdown")
 
-@dataclass
+
+@dataclass(slots=True)
 class PokerState:
     blind_amount: int
     players: List[Player]
@@ -15,7 +19,13 @@ class PokerState:
     dealer_index: int
     current_player: int
     deck: Deck
-    phase: str
+    phase: int
+    # Set when a betting round awards the pot early (everyone else folded) so
+    # the showdown manager does not award it twice
+    _pot_awarded: bool = False
+    # Highest bet posted this betting round; maintained by the betting
+    # manager so nothing has to scan player bets to find it
+    current_bet: int = 0
 
     # Convenience / helper methods used by engine and managers
     def active_players(self) -> List[Player]:
@@ -26,10 +36,35 @@ class PokerState:
         """Return list of players who have not folded and have chips remaining."""
         return [p for p in self.players if not p.folded and p.chips.total() > 0]
 
+    def commit_bet(self, player_idx: int, amount: int) -> bool:
+        """Post up to `amount` from a player into the pot in one step.
+
+        Caps the amount at the player's stack (short all-ins), updates the
+        player's bet and the round's current bet together, and returns True
+        when the player's total bet raised the current bet.
+        """
+        player = self.players[player_idx]
+        available = player.chips.total()
+        actual = amount if amount < available else available
+
+        if actual > 0:
+            try:
+                player.chips.transfer_to(self.pot, actual)
+                player.bet += actual
+            except Exception as e:
+                print(f"Error transferring chips: {e}")
+                return False
+
+        if player.bet > self.current_bet:
+            self.current_bet = player.bet
+            return True
+        return False
+
     def reset_bets(self) -> None:
-        """Reset the `bet` field on all players to zero."""
+        """Reset the `bet` field on all players (and the round's current bet) to zero."""
         for p in self.players:
             p.bet = 0
+        self.current_bet = 0
 
     def reset_round_state(self) -> None:
         """Prepare state for the next round without changing dealer ordering.
@@ -43,7 +78,8 @@ class PokerState:
         self.reset_bets()
         self.community_cards = []
         self.burn_cards = []
-        self.deck = Deck()
+        self.deck.reset()
+        self._pot_awarded = False
 
     def remove_broke_players(self) -> None:
         """Remove players who have no chips left from the game and reindex players.
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from models.chip import ChipHolder
 from models.card import Card
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     player_num: int
     chips: ChipHolder
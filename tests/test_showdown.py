@@ -1,15 +1,19 @@
 import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from engine import PokerEngine
-from models.card import Card, Rank, Suit
+from models.card import CARD_BY_RANK_SUIT, Rank, Suit
 
 
-def scenario_single_active():
+def _make_showdown_engine():
+    """Shared setup: a 3-player engine with $50 already in the pot."""
     pe = PokerEngine(num_players=3, blind_amount=20, chip_breakdown={5: 100})
-    game = pe.game
+    pe.game.pot.add_chips(5, 10)  # $50
+    return pe
 
-    # Give the pot some chips
-    game.pot.add_chips(5, 10)  # $50
+
+def scenario_single_active():
+    pe = _make_showdown_engine()
+    game = pe.game
 
     # Fold players 1 and 2
     game.players[1].folded = True
@@ -26,25 +30,26 @@ def scenario_single_active():
 
 
 def scenario_two_active_showdown():
-    pe = PokerEngine(num_players=3, blind_amount=20, chip_breakdown={5: 100})
+    pe = _make_showdown_engine()
     game = pe.game
 
     # Prepare community cards and hole cards so player0 has best hand
     # Community: 2H, 3H, 4H
-    game.community_cards = [Card(Rank.TWO, Suit.HEARTS), Card(Rank.THREE, Suit.HEARTS), Card(Rank.FOUR, Suit.HEARTS)]
+    game.community_cards = [CARD_BY_RANK_SUIT[Rank.TWO, Suit.HEARTS],
+                            CARD_BY_RANK_SUIT[Rank.THREE, Suit.HEARTS],
+                            CARD_BY_RANK_SUIT[Rank.FOUR, Suit.HEARTS]]
 
     # Player0 hole: 5H, 6H -> makes 2-6 hearts straight flush
-    game.players[0].hand = [Card(Rank.FIVE, Suit.HEARTS), Card(Rank.SIX, Suit.HEARTS)]
+    game.players[0].hand = [CARD_BY_RANK_SUIT[Rank.FIVE, Suit.HEARTS],
+                            CARD_BY_RANK_SUIT[Rank.SIX, Suit.HEARTS]]
 
     # Player1 hole: 7C, 8C -> no better hand
-    game.players[1].hand = [Card(Rank.SEVEN, Suit.CLUBS), Card(Rank.EIGHT, Suit.CLUBS)]
+    game.players[1].hand = [CARD_BY_RANK_SUIT[Rank.SEVEN, Suit.CLUBS],
+                            CARD_BY_RANK_SUIT[Rank.EIGHT, Suit.CLUBS]]
 
     # Ensure player2 folded
     game.players[2].folded = True
 
-    # Put $50 in pot
-    game.pot.add_chips(5, 10)
-
     before0 = game.players[0].chips.total()
     before1 = game.players[1].chips.total()
 